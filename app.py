@@ -8,10 +8,11 @@ import threading
 from flask import Flask, Response
 from dotenv import load_dotenv
 from plivo import plivoxml
+from waitress import serve
 
 from message_parser import TemperatureAction
 from phone_caller import PhoneCaller, get_tts_message
-from slack_bot import TemperatureBot
+from slack_bot import TemperatureBot, configure_logging
 
 # Load environment variables
 load_dotenv()
@@ -20,6 +21,26 @@ load_dotenv()
 flask_app = Flask(__name__)
 
 
+DEFAULT_TTS_MESSAGE = "Hello, this is an automated call from your office regarding temperature control."
+
+
+def _build_xml(tts_message: str) -> str:
+    """Build the Plivo XML that speaks the given message."""
+    response = plivoxml.ResponseElement()
+    response.add(
+        plivoxml.SpeakElement(tts_message, voice="WOMAN", language="en-US")
+    )
+    return response.to_string()
+
+
+# There is only one possible response per action, so render them all up front.
+# Stored as bytes so responses skip per-request encoding.
+_XML_CACHE = {
+    action: _build_xml(get_tts_message(action) or DEFAULT_TTS_MESSAGE).encode("utf-8")
+    for action in TemperatureAction
+}
+
+
 @flask_app.route("/plivo-xml/<action>", methods=["GET", "POST"])
 def plivo_xml(action):
     """
@@ -33,18 +54,7 @@ def plivo_xml(action):
     except ValueError:
         temp_action = TemperatureAction.NONE
 
-    tts_message = get_tts_message(temp_action)
-
-    if not tts_message:
-        tts_message = "Hello, this is an automated call from your office regarding temperature control."
-
-    # Create Plivo XML response
-    response = plivoxml.ResponseElement()
-    response.add(
-        plivoxml.SpeakElement(tts_message, voice="WOMAN", language="en-US")
-    )
-
-    return Response(response.to_string(), mimetype="application/xml")
+    return Response(_XML_CACHE[temp_action], mimetype="application/xml")
 
 
 @flask_app.route("/health", methods=["GET"])
@@ -54,8 +64,8 @@ def health():
 
 
 def run_flask():
-    """Run the Flask server."""
-    flask_app.run(host="0.0.0.0", port=8080, debug=False, use_reloader=False)
+    """Run the Flask app on a multi-threaded WSGI server."""
+    serve(flask_app, host="0.0.0.0", port=8080, threads=8)
 
 
 def run_slack_bot(ngrok_url: str):
@@ -67,6 +77,10 @@ def run_slack_bot(ngrok_url: str):
 
 def main():
     """Main entry point."""
+    # Before waitress starts: its serve() calls logging.basicConfig() itself,
+    # which would leave ours (and LOG_LEVEL) without effect
+    configure_logging()
+
     print("=" * 60)
     print("Temperature Control Automation")
     print("=" * 60)
@@ -3,6 +3,7 @@ Message parser module for detecting temperature-related requests.
 """
 
 from enum import Enum
+import functools
 import re
 
 
@@ -47,36 +48,93 @@ HOT_KEYWORDS = [
     r"cool\s+it\s+down",
 ]
 
+# A keyword that is just a single word wrapped in word boundaries, e.g. r"\bcold\b"
+_WORD_KEYWORD = re.compile(r"\\b(\w+)\\b")
+
+
+def _compile_keywords(patterns: list) -> re.Pattern:
+    """
+    Fuse a keyword list into a single regex.
+
+    Plain word keywords are collected into one literal set behind a single pair
+    of word boundaries; the remaining phrase patterns follow as alternatives.
+    The message is then scanned once per direction instead of once per keyword.
+    """
+    words = []
+    phrases = []
+    for pattern in patterns:
+        match = _WORD_KEYWORD.fullmatch(pattern)
+        if match:
+            words.append(match.group(1))
+        else:
+            phrases.append(f"(?:{pattern})")
+
+    if words:
+        phrases.insert(0, rf"\b(?:{'|'.join(words)})\b")
+    return re.compile("|".join(phrases))
+
+
+_COLD_RE = _compile_keywords(COLD_KEYWORDS)
+_HOT_RE = _compile_keywords(HOT_KEYWORDS)
+
+# Substrings that every match of the corresponding keyword list must contain.
+# Most messages contain none of them, so a plain `in` check lets them skip the
+# regex entirely. Keep these in sync when adding keywords above.
+_COLD_LITERALS = ("cold", "freezing", "chilly", "cool", "shivering", "temp", "turn", "warm")
+_HOT_LITERALS = ("hot", "warm", "sweating", "stuffy", "boiling", "cool", "temp", "turn")
+_ANY_LITERALS = tuple(dict.fromkeys(_COLD_LITERALS + _HOT_LITERALS))
+
+
+def mentions_temperature(message: str) -> bool:
+    """
+    Cheaply check whether a message could be a temperature request.
+
+    A False result guarantees parse_temperature_request would return NONE, so
+    callers can skip parsing (and any work around it) for most messages.
+    """
+    message_lower = message.lower()
+    return any(lit in message_lower for lit in _ANY_LITERALS)
+
 
 def parse_temperature_request(message: str) -> TemperatureAction:
     """
     Analyze a message to determine if it's a temperature change request.
 
+    Results are memoized on the trimmed, lowercased text, since the same short
+    messages tend to recur with only case or whitespace differences.
+
     Args:
         message: The message text to analyze
 
     Returns:
         TemperatureAction indicating what action to take
     """
-    message_lower = message.lower()
+    # Lowercase once rather than compiling with re.IGNORECASE: the literal
+    # pre-filter needs the lowered text anyway, and case-insensitive matching
+    # makes every regex search noticeably slower than one str.lower() call
+    return _classify(message.strip().lower())
+
 
+@functools.lru_cache(maxsize=2048)
+def _classify(message_lower: str) -> TemperatureAction:
+    """Classify an already-normalized message."""
     # Check for cold-related keywords (need to increase temp)
-    for pattern in COLD_KEYWORDS:
-        if re.search(pattern, message_lower):
-            return TemperatureAction.INCREASE
+    if any(lit in message_lower for lit in _COLD_LITERALS) and _COLD_RE.search(message_lower):
+        return TemperatureAction.INCREASE
 
     # Check for hot-related keywords (need to decrease temp)
-    for pattern in HOT_KEYWORDS:
-        if re.search(pattern, message_lower):
-            return TemperatureAction.DECREASE
+    if any(lit in message_lower for lit in _HOT_LITERALS) and _HOT_RE.search(message_lower):
+        return TemperatureAction.DECREASE
 
     return TemperatureAction.NONE
 
 
+_ACTION_DESCRIPTIONS = {
+    TemperatureAction.INCREASE: "increase the temperature (it's too cold)",
+    TemperatureAction.DECREASE: "decrease the temperature (it's too hot)",
+}
+
+
 def get_action_description(action: TemperatureAction) -> str:
     """Get a human-readable description of the action."""
-    if action == TemperatureAction.INCREASE:
-        return "increase the temperature (it's too cold)"
-    elif action == TemperatureAction.DECREASE:
-        return "decrease the temperature (it's too hot)"
-    return "no temperature change needed"
+    return _ACTION_DESCRIPTIONS.get(action, "no temperature change needed")
@@ -3,9 +3,26 @@ Phone caller module using Plivo for automated calls with text-to-speech.
 """
 
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import plivo
 from message_parser import TemperatureAction
 
+# Plivo clients shared across PhoneCaller instances, keyed by credentials, so
+# every caller reuses the same keep-alive HTTP session to the Plivo API
+_plivo_clients = {}
+_plivo_clients_lock = threading.Lock()
+
+
+def _get_plivo_client(auth_id: str, auth_token: str) -> plivo.RestClient:
+    """Return the shared Plivo client for these credentials, creating it on first use."""
+    with _plivo_clients_lock:
+        client = _plivo_clients.get((auth_id, auth_token))
+        if client is None:
+            client = plivo.RestClient(auth_id, auth_token)
+            _plivo_clients[(auth_id, auth_token)] = client
+        return client
+
 
 class PhoneCaller:
     def __init__(self, answer_url_base: str):
@@ -23,8 +40,13 @@ class PhoneCaller:
         if not all([self.auth_id, self.auth_token, self.from_number, self.target_number]):
             raise ValueError("Missing Plivo credentials in environment variables")
 
-        self.client = plivo.RestClient(self.auth_id, self.auth_token)
+        self.client = _get_plivo_client(self.auth_id, self.auth_token)
         self.answer_url_base = answer_url_base
+        self._answer_urls = {
+            a: f"{answer_url_base}/plivo-xml/{a.value}"
+            for a in (TemperatureAction.INCREASE, TemperatureAction.DECREASE)
+        }
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="plivo-call")
 
     def make_temperature_call(self, action: TemperatureAction) -> dict:
         """
@@ -40,7 +62,7 @@ class PhoneCaller:
             return {"success": False, "error": "No action required"}
 
         try:
-            answer_url = f"{self.answer_url_base}/plivo-xml/{action.value}"
+            answer_url = self._answer_urls[action]
 
             response = self.client.calls.create(
                 from_=self.from_number,
@@ -61,21 +83,35 @@ class PhoneCaller:
                 "error": str(e)
             }
 
+    def make_temperature_call_async(self, action: TemperatureAction) -> Future:
+        """
+        Make the temperature call on a background thread.
+
+        Args:
+            action: The temperature action (INCREASE or DECREASE)
+
+        Returns:
+            Future resolving to the dict returned by make_temperature_call
+        """
+        return self._executor.submit(self.make_temperature_call, action)
+
+
+_TTS_MESSAGES = {
+    TemperatureAction.INCREASE: (
+        "Hi, this is an automated call from Plivo. "
+        "The employees have reported that the temperature is too cold. "
+        "Please increase the AC temperature. "
+        "Thank you."
+    ),
+    TemperatureAction.DECREASE: (
+        "Hi, this is an automated call from Plivo. "
+        "The employees have reported that the temperature is too hot. "
+        "Please reduce the AC temperature. "
+        "Thank you."
+    ),
+}
+
 
 def get_tts_message(action: TemperatureAction) -> str:
     """Generate the text-to-speech message based on the action."""
-    if action == TemperatureAction.INCREASE:
-        return (
-            "Hi, this is an automated call from Plivo. "
-            "The employees have reported that the temperature is too cold. "
-            "Please increase the AC temperature. "
-            "Thank you."
-        )
-    elif action == TemperatureAction.DECREASE:
-        return (
-            "Hi, this is an automated call from Plivo. "
-            "The employees have reported that the temperature is too hot. "
-            "Please reduce the AC temperature. "
-            "Thank you."
-        )
-    return ""
+    return _TTS_MESSAGES.get(action, "")
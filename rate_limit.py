@@ -0,0 +1,97 @@
+"""
+Rate limiting helpers for Slack events and phone calls.
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class BucketTimeRateLimit:
+    def __init__(self, buckets: int = 5, bucket_seconds: float = 12, threshold: int = 15):
+        """
+        Per-key sliding-window rate limiter.
+
+        The window is split into time buckets, each holding per-key counters.
+        A key's rate is the sum of its counters across all live buckets; the
+        oldest bucket is dropped as a new one starts, sliding the window.
+
+        Args:
+            buckets: Number of buckets in the window
+            bucket_seconds: Length of each bucket (window = buckets * bucket_seconds)
+            threshold: Maximum events per key allowed within the window
+        """
+        self.bucket_seconds = bucket_seconds
+        self.threshold = threshold
+        self._buckets = deque([{}], maxlen=buckets)
+        self._bucket_start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, key: str) -> bool:
+        """
+        Record an event for key.
+
+        Returns:
+            True if the event is within the limit, False if it should be dropped
+        """
+        with self._lock:
+            self._rotate()
+            current = self._buckets[-1]
+            current[key] = current.get(key, 0) + 1
+            return sum(bucket.get(key, 0) for bucket in self._buckets) <= self.threshold
+
+    def _rotate(self):
+        """Start new buckets for any bucket periods that have elapsed."""
+        elapsed = int((time.monotonic() - self._bucket_start) // self.bucket_seconds)
+        if elapsed <= 0:
+            return
+        # Anything beyond a full window of empty buckets is equivalent
+        for _ in range(min(elapsed, self._buckets.maxlen)):
+            self._buckets.append({})
+        self._bucket_start += elapsed * self.bucket_seconds
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float, tokens: float | None = None):
+        """
+        Token-bucket rate limiter.
+
+        Tokens refill continuously at `rate` per second up to `capacity`, and
+        every permitted action spends one.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the largest burst allowed
+            tokens: Starting tokens (defaults to a full bucket)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity if tokens is None else min(tokens, capacity)
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Spend tokens if enough are available; returns whether they were spent."""
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """Seconds until the given number of tokens will be available (0 if they are now)."""
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def refund(self, tokens: float = 1):
+        """Return tokens spent on an action that did not go ahead."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_update) * self.rate)
+        self._last_update = now
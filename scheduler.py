@@ -0,0 +1,98 @@
+"""
+Scheduler module for running delayed callbacks from a single background thread.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledCall:
+    def __init__(self, deadline: float, callback, args: tuple):
+        """
+        A callback waiting to be run by the scheduler.
+
+        Args:
+            deadline: time.monotonic() value at which the callback is due
+            callback: Function to call
+            args: Positional arguments for the callback
+        """
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Prevent the callback from running if it has not run yet."""
+        self.cancelled = True
+
+
+class PollScheduler:
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize the scheduler.
+
+        One daemon thread sleeps until the earliest deadline in a heap, instead
+        of each delay owning its own Timer thread. The thread is started on
+        first use. Due callbacks are handed to a small worker pool, so a slow
+        callback can't hold back the deadlines behind it.
+
+        Args:
+            max_workers: Number of threads that run due callbacks
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="poll-callback")
+        self._heap = []
+        self._counter = itertools.count()  # Tie-breaker so equal deadlines never compare calls
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def schedule(self, delay: float, callback, *args) -> ScheduledCall:
+        """
+        Run callback(*args) on a worker thread after delay seconds.
+
+        Returns:
+            ScheduledCall that can be cancelled before it runs
+        """
+        call = ScheduledCall(time.monotonic() + delay, callback, args)
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="poll-scheduler", daemon=True)
+                self._thread.start()
+            heapq.heappush(self._heap, (call.deadline, next(self._counter), call))
+            # Wake the thread in case this call is due before the one it is waiting on
+            self._condition.notify()
+        return call
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+                deadline, _, call = self._heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+
+            if not call.cancelled:
+                self._executor.submit(self._invoke, call)
+
+    @staticmethod
+    def _invoke(call: ScheduledCall):
+        # Checked again in case the call was cancelled while it waited for a worker
+        if call.cancelled:
+            return
+        try:
+            call.callback(*call.args)
+        except Exception:
+            logger.exception("[SCHEDULER] Scheduled callback %r failed", call.callback)
+
+
+# Shared by every bot in the process
+poll_scheduler = PollScheduler()
@@ -2,37 +2,75 @@
 Slack bot module for monitoring temperature requests.
 """
 
+import json
 import os
+import re
 import sys
+import atexit
 import logging
+import logging.handlers
 import time
 import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_sdk import WebClient
 
-from message_parser import parse_temperature_request, TemperatureAction, get_action_description
+from message_parser import parse_temperature_request, mentions_temperature, TemperatureAction, get_action_description
 from phone_caller import PhoneCaller
+from rate_limit import BucketTimeRateLimit, TokenBucket
+from scheduler import ScheduledCall, poll_scheduler
 
-# Rate limiting: only allow one call every 1 minute (60 seconds)
-CALL_COOLDOWN_SECONDS = 1 * 60
+# Rate limiting: calls are paced by a token bucket refilled at this rate, holding
+# at most CALL_BURST tokens (1 = one call per minute, no bursts)
+CALLS_PER_MINUTE = 1
+CALL_BURST = 1
 
 # Polling configuration
 POLL_DURATION_SECONDS = 60  # 1 minute
 POLL_EMOJI_AGREE = "+1"      # 👍
 POLL_EMOJI_DISAGREE = "-1"   # 👎
+_POLL_OPTIONS = {POLL_EMOJI_AGREE: "agree", POLL_EMOJI_DISAGREE: "disagree"}
+
+# Slack markup such as <@U123>, <#C123|general>, <!here> and <https://...|label>.
+# Slack escapes literal angle brackets in message text, so every <...> is markup.
+_SLACK_MARKUP_RE = re.compile(r"<[^>]*>")
+
+# Temperature requests arriving within this window are handled as one batch
+REQUEST_BATCH_SECONDS = 5
 
 # File to persist last call time across restarts
 LAST_CALL_FILE = os.path.join(os.path.dirname(__file__), ".last_call_time")
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stdout
-)
+# File to persist the open poll so it can be resumed after a restart
+ACTIVE_POLL_FILE = os.path.join(os.path.dirname(__file__), ".active_poll")
+
 logger = logging.getLogger(__name__)
 
 
+def configure_logging():
+    """
+    Set up logging from LOG_LEVEL (set LOG_LEVEL=INFO in production to drop
+    per-message debug output). Unknown level names fall back to DEBUG.
+
+    Called from app.main() rather than at import, so a LOG_LEVEL from .env is
+    already loaded. Records are buffered and written in batches; anything at
+    INFO or above flushes the buffer immediately so important lines are never
+    held back.
+    """
+    level = logging.getLevelName(os.getenv("LOG_LEVEL", "DEBUG").upper())
+    if not isinstance(level, int):
+        level = logging.DEBUG
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logging.basicConfig(
+        level=level,
+        handlers=[logging.handlers.MemoryHandler(capacity=64, flushLevel=logging.INFO, target=stream_handler)]
+    )
+
+
 def load_last_call_time() -> float:
     """Load the last call time from file."""
     try:
@@ -40,7 +78,7 @@ def load_last_call_time() -> float:
             with open(LAST_CALL_FILE, 'r') as f:
                 return float(f.read().strip())
     except (ValueError, IOError) as e:
-        print(f"[RATE_LIMIT] Could not load last call time: {e}", flush=True)
+        logger.warning("[RATE_LIMIT] Could not load last call time: %s", e)
     return 0
 
 
@@ -49,9 +87,135 @@ def save_last_call_time(timestamp: float):
     try:
         with open(LAST_CALL_FILE, 'w') as f:
             f.write(str(timestamp))
-        print(f"[RATE_LIMIT] Saved last call time to file", flush=True)
+        logger.debug("[RATE_LIMIT] Saved last call time to file")
+    except IOError as e:
+        logger.warning("[RATE_LIMIT] Could not save last call time: %s", e)
+
+
+# Slack Web API clients shared across bot instances, keyed by bot token, so
+# every bot reuses the same client instead of setting up its own
+_web_clients = {}
+_web_clients_lock = threading.Lock()
+
+
+def _get_web_client(token: str) -> WebClient:
+    """Return the shared Slack WebClient for this token, creating it on first use."""
+    with _web_clients_lock:
+        client = _web_clients.get(token)
+        if client is None:
+            client = WebClient(token=token)
+            _web_clients[token] = client
+        return client
+
+
+@dataclass(slots=True)
+class ActivePoll:
+    """A temperature poll that is open for votes."""
+    channel: str
+    ts: str
+    action: TemperatureAction
+    requester: str
+    deadline: float  # time.monotonic() value at which the poll closes
+    requesters: set = field(default_factory=set)  # Everyone who asked for this change; each counts as a 👍 vote
+    electorate: int | None = None  # People in the channel who can vote, if known
+    completion: ScheduledCall | None = None  # Pending scheduled call to _complete_poll
+
+
+def save_active_poll(poll: ActivePoll):
+    """Save the open poll to file."""
+    state = {
+        "channel": poll.channel,
+        "ts": poll.ts,
+        "action": poll.action.value,
+        "requester": poll.requester,
+        "deadline": time.time() + (poll.deadline - time.monotonic()),  # Wall clock, to survive restarts
+        "requesters": sorted(poll.requesters),
+        "electorate": poll.electorate,
+    }
+    try:
+        with open(ACTIVE_POLL_FILE, 'w') as f:
+            json.dump(state, f)
+    except IOError as e:
+        logger.warning("[POLL] Could not save active poll: %s", e)
+
+
+def load_active_poll() -> ActivePoll | None:
+    """Load the poll that was open when the bot last stopped, if any."""
+    try:
+        if os.path.exists(ACTIVE_POLL_FILE):
+            with open(ACTIVE_POLL_FILE, 'r') as f:
+                state = json.load(f)
+            return ActivePoll(
+                channel=state["channel"],
+                ts=state["ts"],
+                action=TemperatureAction(state["action"]),
+                requester=state["requester"],
+                deadline=time.monotonic() + (state["deadline"] - time.time()),  # In the past if the poll expired
+                requesters=set(state["requesters"]),
+                electorate=state["electorate"],
+            )
+    except (ValueError, KeyError, IOError) as e:
+        logger.warning("[POLL] Could not load active poll: %s", e)
+    return None
+
+
+def clear_active_poll():
+    """Remove the saved poll once it has completed."""
+    try:
+        os.remove(ACTIVE_POLL_FILE)
+    except FileNotFoundError:
+        pass
     except IOError as e:
-        print(f"[RATE_LIMIT] Could not save last call time: {e}", flush=True)
+        logger.warning("[POLL] Could not clear active poll: %s", e)
+
+
+class LastCallTime:
+    """
+    Thread-safe last call timestamp kept in memory.
+
+    Each change wakes a background thread that writes it to LAST_CALL_FILE
+    straight away, so callers never wait on disk I/O. It does not rely on the
+    flush at interpreter exit: start.sh restarts the bot with SIGTERM, which
+    skips atexit, and a call placed just before that must not be forgotten.
+
+    The cooldown itself is enforced by the bot's call token bucket; this only
+    carries the last call across restarts so the bucket can be seeded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = load_last_call_time()  # Load from file to survive restarts
+        self._dirty = False
+        self._changed = threading.Event()
+
+        flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        flush_thread.start()
+        atexit.register(self.flush)
+
+    def get(self) -> float:
+        with self._lock:
+            return self._value
+
+    def set(self, timestamp: float):
+        with self._lock:
+            self._value = timestamp
+            self._dirty = True
+        self._changed.set()
+
+    def flush(self):
+        """Write the timestamp to disk if it changed since the last flush."""
+        with self._lock:
+            if not self._dirty:
+                return
+            timestamp = self._value
+            self._dirty = False
+        save_last_call_time(timestamp)
+
+    def _flush_loop(self):
+        while True:
+            self._changed.wait()
+            self._changed.clear()
+            self.flush()
 
 
 class TemperatureBot:
@@ -64,24 +228,51 @@ class TemperatureBot:
         """
         self.phone_caller = phone_caller
         self.channel_name = os.getenv("SLACK_CHANNEL", "plivo_sports_updates")
-        self.last_call_time = load_last_call_time()  # Load from file to survive restarts
-        self.active_poll = None  # Track if there's an active poll
-        print(f"[RATE_LIMIT] Loaded last call time: {self.last_call_time}", flush=True)
-
-        print(f"[INIT] Initializing Slack app...", flush=True)
+        self._app_token = os.getenv("SLACK_APP_TOKEN")
+        self._channel_id = None  # Resolved from channel_name on start; None accepts every channel
+        self.last_call_time = LastCallTime()
+        self.active_poll = None  # ActivePoll while a poll is open
+        self._poll_lock = threading.Lock()  # Held from poll start until the poll completes
+        self.poll_votes = {}  # poll ts -> {"agree": set of user IDs, "disagree": set of user IDs}
+        self._votes_lock = threading.Lock()
+        self._vote_limiter = BucketTimeRateLimit()  # Caps reaction churn per user to stop vote spam
+        self._pending_requests = deque()  # (channel, user, action) awaiting the next batch
+        self._batch_timer = None
+        self._batch_lock = threading.Lock()
+        self._slack_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="slack-api")
+        logger.info("[RATE_LIMIT] Loaded last call time: %s", self.last_call_time.get())
+        # Seed the bucket with whatever has refilled since the persisted last
+        # call; a last call in the future (clock stepped back) counts as now
+        call_rate = CALLS_PER_MINUTE / 60
+        since_last_call = max(0.0, time.time() - self.last_call_time.get())
+        self._call_bucket = TokenBucket(call_rate, CALL_BURST, tokens=since_last_call * call_rate)
+
+        logger.info("[INIT] Initializing Slack app...")
 
         # Initialize Slack app with bot token
-        self.app = App(token=os.getenv("SLACK_BOT_TOKEN"))
+        self.app = App(client=_get_web_client(os.getenv("SLACK_BOT_TOKEN")))
+        self._bot_user_id = self.app.client.auth_test()["user_id"]  # Looked up once, used to skip our own reactions
 
-        print(f"[INIT] Slack app initialized. Registering handlers...", flush=True)
+        logger.info("[INIT] Slack app initialized. Registering handlers...")
 
         # Register message handler
         self._register_handlers()
 
-        print(f"[INIT] Handlers registered.", flush=True)
+        logger.info("[INIT] Handlers registered.")
+
+    def _start_poll(self, channel: str, action: TemperatureAction, requester: str, requesters: set | None = None):
+        """
+        Start a temperature poll in the channel.
+
+        Args:
+            channel: Channel to post the poll in
+            action: Temperature change being voted on
+            requester: User whose request started the poll
+            requesters: Everyone who asked for this change (defaults to just requester).
+                Asking for the change counts as voting for it.
+        """
+        requesters = set(requesters or ()) | {requester}
 
-    def _start_poll(self, channel: str, action: TemperatureAction, requester: str):
-        """Start a temperature poll in the channel."""
         if action == TemperatureAction.DECREASE:
             action_hint = "(make it cooler)"
         else:
@@ -92,52 +283,118 @@ class TemperatureBot:
             f"Please vote:\n"
             f"• 👍 - Yes\n"
             f"• 👎 - No\n\n"
-            f"_Poll ends in {POLL_DURATION_SECONDS} seconds. Action will be taken if majority agrees._"
+            f"_Asking for the change counts as a 👍. Poll ends in {POLL_DURATION_SECONDS} seconds, "
+            f"or as soon as everyone has voted. Action will be taken if majority agrees._"
         )
 
         # Post the poll message
         result = self.app.client.chat_postMessage(channel=channel, text=poll_message)
         poll_ts = result["ts"]
+        # Start tallying before anyone can react
+        self.poll_votes[poll_ts] = {"agree": set(requesters), "disagree": set()}
+
+        # Add reaction emojis to the message and count the electorate, all requests in flight at once
+        electorate = self._slack_executor.submit(self._count_electorate, channel)
+        reactions = [
+            self._slack_executor.submit(self.app.client.reactions_add, channel=channel, timestamp=poll_ts, name=name)
+            for name in (POLL_EMOJI_AGREE, POLL_EMOJI_DISAGREE)
+        ]
+        try:
+            for reaction in reactions:
+                reaction.result()
+        except Exception:
+            # The poll never opened, so stop counting reactions on its message
+            with self._votes_lock:
+                self.poll_votes.pop(poll_ts, None)
+            raise
 
-        # Add reaction emojis to the message
-        self.app.client.reactions_add(channel=channel, timestamp=poll_ts, name=POLL_EMOJI_AGREE)
-        self.app.client.reactions_add(channel=channel, timestamp=poll_ts, name=POLL_EMOJI_DISAGREE)
-
-        print(f"[POLL] Started poll in channel {channel}, message ts: {poll_ts}", flush=True)
+        logger.info("[POLL] Started poll in channel %s, message ts: %s", channel, poll_ts)
 
         # Store active poll info
-        self.active_poll = {
-            "channel": channel,
-            "ts": poll_ts,
-            "action": action,
-            "requester": requester
-        }
+        poll = ActivePoll(channel, poll_ts, action, requester, time.monotonic() + POLL_DURATION_SECONDS,
+                          requesters=requesters, electorate=electorate.result())
 
+        # Save before the poll can complete, so an early close can't clear the
+        # file and have it written again for a poll that has already finished
+        save_active_poll(poll)
+        self.active_poll = poll
         # Schedule poll completion
-        timer = threading.Timer(POLL_DURATION_SECONDS, self._complete_poll, args=[channel, poll_ts, action])
-        timer.start()
+        poll.completion = poll_scheduler.schedule(POLL_DURATION_SECONDS, self._complete_poll, channel, poll_ts, action)
+        # Votes cast while the poll was being set up were tallied before there
+        # was an active poll to check them against
+        self._close_if_everyone_voted(poll)
+
+    def _resume_active_poll(self):
+        """Resume a poll that was still open when the bot last stopped."""
+        poll = load_active_poll()
+        if poll is None:
+            return
+
+        # A poll whose deadline passed while the bot was down is never acted on:
+        # its outcome would be decided by reactions added after it closed
+        if poll.deadline <= time.monotonic():
+            logger.info("[POLL] Saved poll %s expired while the bot was down, dropping it", poll.ts)
+            clear_active_poll()
+            try:
+                self.app.client.chat_postMessage(
+                    channel=poll.channel,
+                    text="⏱️ The temperature poll expired while I was offline. No action will be taken."
+                )
+            except Exception as e:
+                logger.warning("[POLL] Could not report expired poll %s: %s", poll.ts, e)
+            return
+
+        # Votes cast while the bot was down never reached the reaction handlers,
+        # so take the current tally from the poll message itself
+        try:
+            result = self.app.client.reactions_get(channel=poll.channel, timestamp=poll.ts, full=True)
+        except Exception as e:
+            logger.warning("[POLL] Could not resume poll %s: %s", poll.ts, e)
+            clear_active_poll()
+            return
+
+        votes = {"agree": set(), "disagree": set()}
+        for reaction in result.get("message", {}).get("reactions", []):
+            option = _POLL_OPTIONS.get(reaction["name"].split("::")[0])
+            if option is not None:
+                votes[option].update(u for u in reaction.get("users", []) if u != self._bot_user_id)
+        votes["agree"] |= poll.requesters
+
+        self._poll_lock.acquire()
+        self.poll_votes[poll.ts] = votes
+        self.active_poll = poll
+        delay = max(0.0, poll.deadline - time.monotonic())
+        poll.completion = poll_scheduler.schedule(delay, self._complete_poll, poll.channel, poll.ts, poll.action)
+        logger.info("[POLL] Resumed poll %s, closing in %d seconds", poll.ts, delay)
+        self._close_if_everyone_voted(poll)
+
+    def _count_electorate(self, channel: str) -> int | None:
+        """Count the people who can vote in a channel, or None if it can't be looked up."""
+        try:
+            result = self.app.client.conversations_info(channel=channel, include_num_members=True)
+            return result["channel"]["num_members"] - 1  # Everyone but this bot
+        except Exception as e:
+            logger.warning("[POLL] Could not count channel members (%s); polls will run the full duration", e)
+            return None
 
     def _complete_poll(self, channel: str, poll_ts: str, action: TemperatureAction):
         """Complete the poll and take action based on results."""
-        print(f"[POLL] Completing poll {poll_ts}", flush=True)
-
-        try:
-            # Get reactions on the poll message
-            result = self.app.client.reactions_get(channel=channel, timestamp=poll_ts)
-            reactions = result.get("message", {}).get("reactions", [])
+        # Votes were tallied from reaction events while the poll was open. The
+        # poll may already have been completed early, in which case they're gone.
+        with self._votes_lock:
+            votes = self.poll_votes.pop(poll_ts, None)
+        if votes is None:
+            return
 
-            agree_count = 0
-            disagree_count = 0
+        logger.info("[POLL] Completing poll %s", poll_ts)
 
-            for reaction in reactions:
-                if reaction["name"] == POLL_EMOJI_AGREE:
-                    # Subtract 1 because bot adds the initial reaction
-                    agree_count = reaction["count"] - 1
-                elif reaction["name"] == POLL_EMOJI_DISAGREE:
-                    disagree_count = reaction["count"] - 1
+        try:
+            agree_count = len(votes["agree"])
+            disagree_count = len(votes["disagree"])
 
             total_votes = agree_count + disagree_count
-            print(f"[POLL] Results - Agree: {agree_count}, Disagree: {disagree_count}, Total: {total_votes}", flush=True)
+            logger.info("[POLL] Results - Agree: %d, Disagree: %d, Total: %d, Requesters: %d", agree_count,
+                        disagree_count, total_votes, len(self.active_poll.requesters) if self.active_poll else 0)
 
             # Check for simple majority
             if total_votes == 0:
@@ -156,102 +413,268 @@ class TemperatureBot:
                 )
 
         except Exception as e:
-            print(f"[POLL] Error completing poll: {e}", flush=True)
+            logger.exception("[POLL] Error completing poll: %s", e)
             self.app.client.chat_postMessage(
                 channel=channel,
                 text=f"❌ Error processing poll results: {str(e)}"
             )
         finally:
             self.active_poll = None
+            clear_active_poll()
+            self._poll_lock.release()
+
+    def _is_poll_vote(self, event: dict) -> bool:
+        """Match reactions by people on an open poll, before Bolt dispatches a handler."""
+        return event.get("user") != self._bot_user_id and event.get("item", {}).get("ts") in self.poll_votes
+
+    def _record_vote(self, event: dict, added: bool):
+        """Add or remove a user's vote when they react to an open poll."""
+        votes = self.poll_votes.get(event["item"]["ts"])
+        if votes is None:  # Poll completed since the event was matched
+            return
+        user = event["user"]
+
+        # Skin-tone variants arrive as e.g. "+1::skin-tone-2"
+        option = _POLL_OPTIONS.get(event.get("reaction", "").split("::")[0])
+        if option is None:
+            return
+
+        # Only new votes are limited: dropping a removal would leave a vote
+        # counted that the user has already taken back
+        if added and not self._vote_limiter.record(user):
+            logger.debug("[POLL] Dropping reaction from %s - too many reactions in the last minute", user)
+            return
+
+        with self._votes_lock:
+            if added:
+                votes[option].add(user)
+            else:
+                votes[option].discard(user)
+        logger.debug("[POLL] Vote %s: %s %s", "added" if added else "removed", user, option)
+
+        poll = self.active_poll
+        if poll is not None and poll.ts == event["item"]["ts"]:
+            self._close_if_everyone_voted(poll)
+
+    def _close_if_everyone_voted(self, poll: ActivePoll):
+        """Close the poll now if everyone in the channel has voted, rather than make the room wait it out."""
+        with self._votes_lock:
+            votes = self.poll_votes.get(poll.ts)
+            # Only the first caller to reach quorum closes the poll
+            if votes is None or not poll.electorate or poll.completion is None or poll.completion.cancelled:
+                return
+            if len(votes["agree"] | votes["disagree"]) < poll.electorate:
+                return
+            poll.completion.cancel()
+        logger.info("[POLL] Everyone has voted - closing poll %s early", poll.ts)
+        poll_scheduler.schedule(0, self._complete_poll, poll.channel, poll.ts, poll.action)
 
     def _execute_temperature_action(self, channel: str, action: TemperatureAction, agree: int, disagree: int):
-        """Execute the temperature change after poll approval."""
-        print(f"[CALL] Poll passed - initiating phone call...", flush=True)
+        """Start the temperature change call after poll approval without waiting for it."""
+        logger.info("[CALL] Poll passed - initiating phone call...")
+
+        # Spend the call token now so no new poll can start while the call is
+        # in flight; it is refunded if the call fails
+        if not self._call_bucket.try_acquire():
+            logger.warning("[RATE_LIMIT] Poll passed but the call rate limit was reached")
+            self.app.client.chat_postMessage(
+                channel=channel,
+                text=f"⏱️ Poll passed ({agree} yes, {disagree} no), but a call was placed too recently. No action will be taken."
+            )
+            return
+        previous_call_time = self.last_call_time.get()
+        self.last_call_time.set(time.time())
 
-        result = self.phone_caller.make_temperature_call(action)
-        print(f"[CALL] Result: {result}", flush=True)
+        future = self.phone_caller.make_temperature_call_async(action)
+        future.add_done_callback(
+            lambda f: self._on_call_finished(f, channel, action, agree, disagree, previous_call_time)
+        )
+
+    def _on_call_finished(self, future, channel: str, action: TemperatureAction, agree: int, disagree: int,
+                          previous_call_time: float):
+        """Report the outcome of a temperature call to Slack."""
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        logger.info("[CALL] Result: %s", result)
 
         if result["success"]:
-            current_time = time.time()
-            self.last_call_time = current_time
-            save_last_call_time(current_time)
             action_desc = get_action_description(action)
             self.app.client.chat_postMessage(
                 channel=channel,
                 text=f"✅ Poll passed ({agree} yes, {disagree} no)! Calling facilities to {action_desc}."
             )
-            print(f"[CALL] Success - posted confirmation to Slack", flush=True)
+            logger.info("[CALL] Success - posted confirmation to Slack")
         else:
+            self._call_bucket.refund()
+            self.last_call_time.set(previous_call_time)
             self.app.client.chat_postMessage(
                 channel=channel,
                 text=f"⏱️ Poll passed ({agree} yes, {disagree} no), but couldn't place the call. Error: {result.get('error', 'Unknown error')}"
             )
-            print(f"[CALL] Failed: {result.get('error')}", flush=True)
+            logger.warning("[CALL] Failed: %s", result.get("error"))
+
+    def _queue_request(self, channel: str, user: str, action: TemperatureAction):
+        """Add a temperature request to the current batch, starting a new batch window if needed."""
+        with self._batch_lock:
+            self._pending_requests.append((channel, user, action))
+            if self._batch_timer is None:
+                self._batch_timer = poll_scheduler.schedule(REQUEST_BATCH_SECONDS, self._process_pending_requests)
+
+    def _process_pending_requests(self):
+        """Handle a batch of temperature requests as a single request for the most requested action."""
+        with self._batch_lock:
+            requests = list(self._pending_requests)
+            self._pending_requests.clear()
+            self._batch_timer = None
+
+        if not requests:
+            return
+
+        # Most requested action wins; ties go to whichever was requested first
+        action = Counter(a for _, _, a in requests).most_common(1)[0][0]
+        channel, user, _ = next(r for r in requests if r[2] == action)
+        logger.info("[BATCH] %d request(s) in window, handling as %s", len(requests), action.value)
+
+        # Check rate limiting
+        wait_seconds = self._call_bucket.wait_time()
+
+        if wait_seconds > 0:
+            remaining_minutes = int(wait_seconds / 60)
+            logger.info("[RATE_LIMIT] Call skipped - cooldown active. %d minutes remaining.", remaining_minutes)
+            self.app.client.chat_postMessage(
+                channel=channel,
+                text=f"I noticed the temperature request, but a call was already made recently. "
+                     f"To avoid duplicate calls, please wait {remaining_minutes} more minutes before the next call can be placed."
+            )
+            return
+
+        # Check if there's already an active poll; claiming the lock is the
+        # check, so two requests can never both start a poll
+        if not self._poll_lock.acquire(blocking=False):
+            # Fold repeat requests into the open poll rather than replying to
+            # each one; the poll message already asks everyone to vote
+            poll = self.active_poll
+            if poll is not None and poll.action == action:
+                with self._votes_lock:
+                    # Completing the poll pops its tally before clearing the
+                    # file, so this can't save a poll that has already ended
+                    votes = self.poll_votes.get(poll.ts)
+                    if votes is not None:
+                        new_requesters = {u for _, u, a in requests if a == action}
+                        poll.requesters.update(new_requesters)
+                        votes["agree"].update(new_requesters)
+                        save_active_poll(poll)
+                logger.info("[POLL] Poll already active for %s, now %d requester(s)", action.value, len(poll.requesters))
+                self._close_if_everyone_voted(poll)
+            elif poll is not None:
+                logger.info("[POLL] Poll already active for %s, ignoring %s request", poll.action.value, action.value)
+                self.app.client.chat_postMessage(
+                    channel=channel,
+                    text=f"A poll to {get_action_description(poll.action)} is already open. "
+                         f"Vote 👎 on it if you disagree."
+                )
+            else:
+                logger.info("[POLL] Poll already active, ignoring %s request", action.value)
+            return
+
+        # Start a poll instead of making an immediate call
+        logger.info("[POLL] Starting temperature poll...")
+        try:
+            self._start_poll(channel, action, user, {u for _, u, a in requests if a == action})
+        except Exception:
+            self._poll_lock.release()
+            raise
+
+    def _is_monitored_message(self, event: dict) -> bool:
+        """Match human messages in the monitored channel that may be temperature requests, before dispatch."""
+        # Ignore bot messages (including our own polls) and message edits
+        if event.get("subtype") or event.get("bot_id"):
+            return False
+        if self._channel_id is not None and event.get("channel") != self._channel_id:
+            return False
+        return mentions_temperature(event.get("text", ""))
+
+    def _resolve_channel_id(self):
+        """Look up the ID of the monitored channel so messages can be filtered by it."""
+        try:
+            cursor = None
+            while True:
+                result = self.app.client.conversations_list(
+                    types="public_channel,private_channel", exclude_archived=True, limit=200, cursor=cursor
+                )
+                for channel in result["channels"]:
+                    if channel["name"] == self.channel_name:
+                        self._channel_id = channel["id"]
+                        logger.info("[START] Monitoring channel #%s (%s)", self.channel_name, self._channel_id)
+                        return
+                cursor = result.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+            logger.warning("[START] Channel #%s not found; listening to all channels", self.channel_name)
+        except Exception as e:
+            logger.warning("[START] Could not resolve channel #%s (%s); listening to all channels", self.channel_name, e)
 
     def _register_handlers(self):
         """Register event handlers for the Slack app."""
 
-        @self.app.event("message")
-        def handle_message(event, say, logger):
+        @self.app.event("message", matchers=[self._is_monitored_message])
+        def handle_message(event):
             """Handle incoming messages in channels."""
-            print(f"[MESSAGE] Received event: {event}", flush=True)
-
-            # Ignore bot messages and message edits
-            if event.get("subtype"):
-                print(f"[MESSAGE] Ignoring message with subtype: {event.get('subtype')}", flush=True)
-                return
+            logger.debug("[MESSAGE] Received event: %s", event)
 
             text = event.get("text", "")
             channel = event.get("channel")
             user = event.get("user")
 
-            print(f"[MESSAGE] From user {user} in channel {channel}: {text}", flush=True)
+            logger.debug("[MESSAGE] From user %s in channel %s: %s", user, channel, text)
 
-            # Parse the message for temperature requests
-            action = parse_temperature_request(text)
-            print(f"[MESSAGE] Parsed action: {action}", flush=True)
+            # Parse the message for temperature requests, ignoring mentions and links
+            action = parse_temperature_request(_SLACK_MARKUP_RE.sub(" ", text))
+            logger.debug("[MESSAGE] Parsed action: %s", action)
 
             if action != TemperatureAction.NONE:
-                print(f"[ACTION] Temperature action detected: {action.value}", flush=True)
-
-                # Check rate limiting
-                current_time = time.time()
-                time_since_last_call = current_time - self.last_call_time
-
-                if time_since_last_call < CALL_COOLDOWN_SECONDS:
-                    remaining_minutes = int((CALL_COOLDOWN_SECONDS - time_since_last_call) / 60)
-                    print(f"[RATE_LIMIT] Call skipped - cooldown active. {remaining_minutes} minutes remaining.", flush=True)
-                    say(
-                        f"I noticed the temperature request, but a call was already made recently. "
-                        f"To avoid duplicate calls, please wait {remaining_minutes} more minutes before the next call can be placed."
-                    )
-                    return
-
-                # Check if there's already an active poll
-                if self.active_poll is not None:
-                    print(f"[POLL] Poll already active, ignoring new request", flush=True)
-                    say(f"A temperature poll is already in progress. Please vote on the existing poll!")
-                    return
-
-                # Start a poll instead of making an immediate call
-                print(f"[POLL] Starting temperature poll...", flush=True)
-                self._start_poll(channel, action, user)
+                logger.info("[ACTION] Temperature action detected: %s", action.value)
+                self._queue_request(channel, user, action)
+
+        @self.app.event("message")
+        def ignore_message():
+            """Swallow messages filtered out above, so Bolt doesn't log each one as unhandled."""
+
+        @self.app.event("reaction_added", matchers=[self._is_poll_vote])
+        def handle_reaction_added(event):
+            """Count a vote on an open poll."""
+            self._record_vote(event, added=True)
+
+        @self.app.event("reaction_removed", matchers=[self._is_poll_vote])
+        def handle_reaction_removed(event):
+            """Withdraw a vote on an open poll."""
+            self._record_vote(event, added=False)
+
+        def ignore_reaction():
+            """Swallow our own reactions and reactions elsewhere, so Bolt doesn't log them as unhandled."""
+
+        self.app.event("reaction_added")(ignore_reaction)
+        self.app.event("reaction_removed")(ignore_reaction)
 
     def start(self):
         """Start the bot using Socket Mode."""
-        app_token = os.getenv("SLACK_APP_TOKEN")
-        if not app_token:
+        if not self._app_token:
             raise ValueError("SLACK_APP_TOKEN is required for Socket Mode")
 
-        print(f"[START] Creating SocketModeHandler...", flush=True)
-        handler = SocketModeHandler(self.app, app_token)
+        self._resolve_channel_id()
+        self._resume_active_poll()
+
+        logger.info("[START] Creating SocketModeHandler...")
+        handler = SocketModeHandler(self.app, self._app_token)
 
-        print(f"", flush=True)
-        print(f"=" * 50, flush=True)
-        print(f"Temperature bot is running!", flush=True)
-        print(f"Monitoring channel: #{self.channel_name}", flush=True)
-        print(f"Waiting for temperature-related messages...", flush=True)
-        print(f"=" * 50, flush=True)
-        print(f"", flush=True)
+        print()
+        print("=" * 50)
+        print("Temperature bot is running!")
+        print(f"Monitoring channel: #{self.channel_name}")
+        print("Waiting for temperature-related messages...")
+        print("=" * 50)
+        print(flush=True)
 
         handler.start()